@@ -1,21 +1,23 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import os
 import re
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
+from types import MappingProxyType
 from decimal import Decimal
 
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from dotenv import load_dotenv
 from loguru import logger
 from pydantic import BaseModel, Field
-from PIL import Image
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.platypus import Flowable, SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from jinja2 import Environment, FileSystemLoader
 
 # Load environment variables
@@ -71,14 +73,179 @@ class ContractResponse(BaseModel):
     """Structured contract response"""
     sections: List[ContractSection]
 
+class ProposalContent(BaseModel):
+    """Value proposition and contract generated together in one call"""
+    value_proposition: ValuePropositionResponse
+    contract: ContractResponse
+
+CLAUDE_MODEL = "claude-3-5-sonnet-20241022"
+
+# Contract sections requested by both the standalone and the combined contract prompts
+CONTRACT_SECTIONS = (
+    'Scope of Services',
+    'Pricing and Payment Terms',
+    'Service Level Agreement',
+    'Term and Termination',
+    'Confidentiality',
+    'Intellectual Property',
+    'Limitation of Liability',
+    'General Terms and Conditions',
+)
+CONTRACT_SECTIONS_PROMPT = (
+    "the following sections, each with a title, content and optional subsections that have a title and content:\n"
+    + "\n".join(f"{i}. {section}" for i, section in enumerate(CONTRACT_SECTIONS, 1))
+)
+
+# Tool definitions used to get structured output from Claude instead of free-form JSON text
+VALUE_PROPOSITION_TOOL = {
+    "name": "record_value_proposition",
+    "description": "Record the value proposition for the proposal",
+    "input_schema": ValuePropositionResponse.model_json_schema()
+}
+CONTRACT_TOOL = {
+    "name": "record_contract",
+    "description": "Record the contract terms for the proposal",
+    "input_schema": ContractResponse.model_json_schema()
+}
+PROPOSAL_CONTENT_TOOL = {
+    "name": "record_proposal_content",
+    "description": "Record the value proposition and contract terms for the proposal",
+    "input_schema": ProposalContent.model_json_schema()
+}
+
+_CODE_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$')
+
+def _response_input(message: Any) -> Dict[str, Any]:
+    """Return the structured payload of a Claude message"""
+    # Prefer the tool_use block; fall back to JSON text, possibly wrapped in a code fence
+    text_parts = []
+    for block in message.content:
+        if block.type == 'tool_use':
+            return block.input
+        if block.type == 'text':
+            text_parts.append(block.text)
+    return json.loads(_CODE_FENCE_RE.sub('', ''.join(text_parts).strip()))
+
+def _check_keys(data: Dict[str, Any], keys: Tuple[str, ...], name: str) -> None:
+    """Cheap shape check for LLM output that is built without validation"""
+    missing = [key for key in keys if key not in data]
+    if missing:
+        raise ValueError(f"{name} response is missing keys: {', '.join(missing)}")
+
+def _construct_value_proposition(data: Dict[str, Any]) -> ValuePropositionResponse:
+    """Build a ValuePropositionResponse from LLM output, skipping Pydantic validation"""
+    _check_keys(data, ('introduction', 'sections', 'conclusion'), 'Value proposition')
+    sections = []
+    for section in data['sections']:
+        _check_keys(section, ('title', 'points'), 'Value proposition section')
+        sections.append(ValuePropositionSection.model_construct(**section))
+    return ValuePropositionResponse.model_construct(
+        introduction=data['introduction'],
+        sections=sections,
+        conclusion=data['conclusion']
+    )
+
+def _construct_contract(data: Dict[str, Any]) -> ContractResponse:
+    """Build a ContractResponse from LLM output, skipping Pydantic validation"""
+    _check_keys(data, ('sections',), 'Contract')
+    sections = []
+    for section in data['sections']:
+        _check_keys(section, ('title', 'content'), 'Contract section')
+        sections.append(ContractSection.model_construct(**section))
+    return ContractResponse.model_construct(sections=sections)
+
+PREFIX_RE = re.compile(
+    r'^(?P<key>Customer:|ADDRESS:|URL:|BUSINESS OF CUSTOMER:|PRODUCT BEING SOLD:|VALUE PROPOSITION:'
+    r'|SETUP FEE:|USAGE FEE FOR A CAMPAIGN|PAYMENT TERMS:)\s*(?P<val>.*)$'
+)
+DIGITS_RE = re.compile(r'\d+')
+PRICE_RE = re.compile(r'\d*\.?\d+')
+
+def _digits(text: str) -> str:
+    """Return all digits in text, e.g. '$1,500 USD' -> '1500'"""
+    return ''.join(DIGITS_RE.findall(text))
+
+def _set_customer_name(sections: Dict[str, Any], current_section: Optional[str], value: str) -> Optional[str]:
+    sections['customer']['name'] = value
+    return 'customer'
+
+def _set_address(sections: Dict[str, Any], current_section: Optional[str], value: str) -> Optional[str]:
+    if current_section == 'customer':
+        sections['customer']['address'] = value
+    elif current_section == 'product':
+        sections['product']['company_address'] = value
+    return current_section
+
+def _set_url(sections: Dict[str, Any], current_section: Optional[str], value: str) -> Optional[str]:
+    if current_section == 'customer':
+        sections['customer']['url'] = value
+    elif current_section == 'product':
+        sections['product']['url'] = value
+    return current_section
+
+def _set_business_description(sections: Dict[str, Any], current_section: Optional[str], value: str) -> Optional[str]:
+    sections['customer']['business_description'] = value
+    return current_section
+
+def _set_product_name(sections: Dict[str, Any], current_section: Optional[str], value: str) -> Optional[str]:
+    sections['product']['name'] = value
+    return 'product'
+
+def _set_value_proposition(sections: Dict[str, Any], current_section: Optional[str], value: str) -> Optional[str]:
+    sections['product']['value_proposition'] = value
+    return current_section
+
+def _set_setup_fee(sections: Dict[str, Any], current_section: Optional[str], value: str) -> Optional[str]:
+    sections['setup']['fee'] = Decimal(_digits(value))
+    return 'setup'
+
+def _start_pricing(sections: Dict[str, Any], current_section: Optional[str], value: str) -> Optional[str]:
+    return 'pricing'
+
+def _start_payment_terms(sections: Dict[str, Any], current_section: Optional[str], value: str) -> Optional[str]:
+    return 'payment'
+
+PREFIX_HANDLERS = {
+    'Customer:': _set_customer_name,
+    'ADDRESS:': _set_address,
+    'URL:': _set_url,
+    'BUSINESS OF CUSTOMER:': _set_business_description,
+    'PRODUCT BEING SOLD:': _set_product_name,
+    'VALUE PROPOSITION:': _set_value_proposition,
+    'SETUP FEE:': _set_setup_fee,
+    'USAGE FEE FOR A CAMPAIGN': _start_pricing,
+    'PAYMENT TERMS:': _start_payment_terms,
+}
+# First characters of every field prefix; other lines can skip the regex entirely
+PREFIX_INITIALS = frozenset(key[0] for key in PREFIX_HANDLERS)
+
+def _add_list_item(sections: Dict[str, Any], current_section: Optional[str], item: str) -> None:
+    """Handle a '- ' bullet line according to the current section"""
+    if current_section == 'setup':
+        sections['setup']['items'].append(item)
+    elif current_section == 'payment':
+        sections['payment']['terms'].append(item)
+    elif current_section == 'pricing':
+        # Parse pricing tier
+        if 'FOR UP TO' in item:
+            try:
+                parts = item.split(':')
+                contacts = int(_digits(parts[0]))
+                price_parts = parts[1].strip().split('(')
+                price = Decimal(_digits(price_parts[0]))
+                price_per_contact = Decimal(PRICE_RE.search(price_parts[1].split()[0].replace(',', '')).group())
+            except (IndexError, AttributeError, ValueError, ArithmeticError) as e:
+                raise ValueError(f"Could not parse pricing tier: {item}") from e
+            tier = {
+                'contacts': contacts,
+                'price': price,
+                'price_per_contact': price_per_contact
+            }
+            sections['pricing']['tiers'].append(tier)
+
 def load_brief(file_path: str) -> ProposalBrief:
     """Load and parse the proposal brief from file"""
     try:
-        with open(file_path, 'r') as f:
-            lines = [line.strip() for line in f.readlines() if line.strip()]
-        
-        logger.debug(f"Read {len(lines)} lines from brief file")
-        
         # Parse the brief file
         sections = {
             'customer': {},
@@ -89,87 +256,44 @@ def load_brief(file_path: str) -> ProposalBrief:
         }
         
         current_section = None
+        line_count = 0
         
-        for i, line in enumerate(lines):
-            logger.debug(f"Processing line {i+1}: {line}")
-            if line.startswith('Customer:'):
-                current_section = 'customer'
-                sections['customer']['name'] = line.split(':', 1)[1].strip()
-                logger.debug(f"Found customer name: {sections['customer']['name']}")
-            elif line.startswith('ADDRESS:'):
-                if current_section == 'customer':
-                    sections['customer']['address'] = line.split(':', 1)[1].strip()
-                    logger.debug(f"Found customer address: {sections['customer']['address']}")
-                elif current_section == 'product':
-                    sections['product']['company_address'] = line.split(':', 1)[1].strip()
-                    logger.debug(f"Found company address: {sections['product']['company_address']}")
-            elif line.startswith('URL:'):
-                if current_section == 'customer':
-                    sections['customer']['url'] = line.split(':', 1)[1].strip()
-                    logger.debug(f"Found customer URL: {sections['customer']['url']}")
-                elif current_section == 'product':
-                    sections['product']['url'] = line.split(':', 1)[1].strip()
-                    logger.debug(f"Found product URL: {sections['product']['url']}")
-            elif line.startswith('BUSINESS OF CUSTOMER:'):
-                sections['customer']['business_description'] = line.split(':', 1)[1].strip()
-                logger.debug(f"Found business description: {sections['customer']['business_description']}")
-            elif line.startswith('PRODUCT BEING SOLD:'):
-                current_section = 'product'
-                sections['product']['name'] = line.split(':', 1)[1].strip()
-                logger.debug(f"Found product name: {sections['product']['name']}")
-            elif line.startswith('VALUE PROPOSITION:'):
-                sections['product']['value_proposition'] = line.split(':', 1)[1].strip()
-                logger.debug(f"Found value proposition: {sections['product']['value_proposition']}")
-            elif line.startswith('SETUP FEE:'):
-                current_section = 'setup'
-                fee_str = line.split(':', 1)[1].strip()
-                sections['setup']['fee'] = Decimal(''.join(filter(str.isdigit, fee_str)))
-                logger.debug(f"Found setup fee: {sections['setup']['fee']}")
-            elif line.startswith('- '):
-                if current_section == 'setup':
-                    sections['setup']['items'].append(line[2:].strip())
-                    logger.debug(f"Found setup item: {line[2:].strip()}")
-                elif current_section == 'payment':
-                    sections['payment']['terms'].append(line[2:].strip())
-                    logger.debug(f"Found payment term: {line[2:].strip()}")
-                elif current_section == 'pricing':
-                    # Parse pricing tier
-                    if 'FOR UP TO' in line:
-                        parts = line[2:].split(':')
-                        contacts = int(''.join(filter(str.isdigit, parts[0])))
-                        price_parts = parts[1].strip().split('(')
-                        price = Decimal(''.join(filter(str.isdigit, price_parts[0])))
-                        price_per_contact = Decimal(''.join(filter(lambda x: x.isdigit() or x == '.', price_parts[1].split()[0])))
-                        tier = {
-                            'contacts': contacts,
-                            'price': price,
-                            'price_per_contact': price_per_contact
-                        }
-                        sections['pricing']['tiers'].append(tier)
-                        logger.debug(f"Found pricing tier: {tier}")
-            elif line.startswith('USAGE FEE FOR A CAMPAIGN'):
-                current_section = 'pricing'
-                logger.debug("Switched to pricing section")
-            elif line.startswith('PAYMENT TERMS:'):
-                current_section = 'payment'
-                logger.debug("Switched to payment terms section")
-
+        # Stream the file in a single pass instead of materializing every line
+        with open(file_path, 'r') as f:
+            for raw in f:
+                line = raw.strip()
+                if not line:
+                    continue
+                line_count += 1
+                first = line[0]
+                if first == '-':
+                    if line.startswith('- '):
+                        _add_list_item(sections, current_section, line[2:].strip())
+                elif first in PREFIX_INITIALS:
+                    match = PREFIX_RE.match(line)
+                    if match:
+                        handler = PREFIX_HANDLERS[match.group('key')]
+                        current_section = handler(sections, current_section, match.group('val'))
+        
+        # Use loguru's deferred {} formatting so nothing is interpolated unless DEBUG is enabled
+        logger.debug("Read {} lines from brief file", line_count)
         logger.debug("Parsed sections:")
-        logger.debug(f"Customer: {sections['customer']}")
-        logger.debug(f"Product: {sections['product']}")
-        logger.debug(f"Setup: {sections['setup']}")
-        logger.debug(f"Pricing: {sections['pricing']}")
-        logger.debug(f"Payment: {sections['payment']}")
-
-        # Create the ProposalBrief object
-        brief = ProposalBrief(
-            customer=CompanyInfo(
+        logger.debug("Customer: {}", sections['customer'])
+        logger.debug("Product: {}", sections['product'])
+        logger.debug("Setup: {}", sections['setup'])
+        logger.debug("Pricing: {}", sections['pricing'])
+        logger.debug("Payment: {}", sections['payment'])
+
+        # Create the ProposalBrief object. Every value already has its final type
+        # from the parser above, so the models are constructed without re-validation
+        brief = ProposalBrief.model_construct(
+            customer=CompanyInfo.model_construct(
                 name=sections['customer']['name'],
                 address=sections['customer']['address'],
                 url=sections['customer']['url'],
                 business_description=sections['customer']['business_description']
             ),
-            product=ProductInfo(
+            product=ProductInfo.model_construct(
                 name=sections['product']['name'],
                 value_proposition=sections['product']['value_proposition'],
                 url=sections['product']['url'],
@@ -177,7 +301,7 @@ def load_brief(file_path: str) -> ProposalBrief:
             ),
             setup_fee=sections['setup']['fee'],
             setup_items=sections['setup']['items'],
-            pricing_tiers=[PricingTier(**tier) for tier in sections['pricing']['tiers']],
+            pricing_tiers=[PricingTier.model_construct(**tier) for tier in sections['pricing']['tiers']],
             payment_terms=sections['payment']['terms']
         )
         
@@ -187,6 +311,99 @@ def load_brief(file_path: str) -> ProposalBrief:
         logger.error(f"Error loading brief: {str(e)}")
         raise
 
+# Stylesheets are built once at import time and shared by every generator
+_BASE_STYLES = getSampleStyleSheet()
+_CUSTOM_STYLES = {
+    'Heading1': ParagraphStyle(
+        'Heading1',
+        parent=_BASE_STYLES['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        textColor=colors.HexColor('#1a73e8')
+    ),
+    'Heading2': ParagraphStyle(
+        'Heading2',
+        parent=_BASE_STYLES['Heading2'],
+        fontSize=18,
+        spaceAfter=20,
+        textColor=colors.HexColor('#333333')
+    ),
+    'Normal': ParagraphStyle(
+        'Normal',
+        parent=_BASE_STYLES['Normal'],
+        fontSize=12,
+        spaceAfter=12,
+        textColor=colors.HexColor('#333333')
+    ),
+    'Quote': ParagraphStyle(
+        'Quote',
+        parent=_BASE_STYLES['Normal'],
+        fontSize=12,
+        leftIndent=30,
+        rightIndent=30,
+        spaceAfter=20,
+        textColor=colors.HexColor('#666666'),
+        fontStyle='italic'
+    ),
+    'List': ParagraphStyle(
+        'List',
+        parent=_BASE_STYLES['Normal'],
+        fontSize=12,
+        leftIndent=30,
+        spaceAfter=10,
+        bulletIndent=20,
+        textColor=colors.HexColor('#333333')
+    )
+}
+
+# Page setup shared by every proposal document
+DOC_KWARGS = MappingProxyType(dict(
+    pagesize=letter,
+    rightMargin=72,
+    leftMargin=72,
+    topMargin=72,
+    bottomMargin=72
+))
+
+# The Jinja environment and proposal template are compiled once at import time
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(Path(__file__).parent / 'templates'),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=400
+)
+_PROPOSAL_TPL = _JINJA_ENV.get_template('proposal.html')
+
+# Sections listed in the table of contents of every proposal
+TOC_SECTIONS = ('Executive Summary', 'Value Proposition', 'Scope of Work', 'Pricing', 'Terms and Conditions')
+
+def _static_flowables(h1: ParagraphStyle, normal: ParagraphStyle) -> Tuple[Tuple[Flowable, ...], Tuple[Flowable, ...]]:
+    """Build the cover title and table of contents flowables, which are identical in every proposal"""
+    cover_title = (
+        Paragraph("Project Proposal", h1),
+        Spacer(1, inch),
+        Paragraph("Prepared for:", normal),
+    )
+    toc = (
+        Paragraph("Table of Contents", h1),
+        *(Paragraph(f"{i}. {section}", normal) for i, section in enumerate(TOC_SECTIONS, 1)),
+        PageBreak(),
+    )
+    return cover_title, toc
+
+def _pricing_rows(brief: ProposalBrief) -> List[List[str]]:
+    """Format the pricing tiers as (contacts, price, per contact) display strings"""
+    # Format with Decimal so prices round exactly as written (e.g. 0.015 -> 0.02)
+    return [
+        [f"{tier.contacts:,}", f"${tier.price:,.2f}", f"${tier.price_per_contact:.2f}"]
+        for tier in brief.pricing_tiers
+    ]
+
+def _build_pdf(story: List[Flowable], output_path: str) -> None:
+    """Render a story to a PDF file; module-level so it can run in a worker process"""
+    doc = SimpleDocTemplate(output_path, **DOC_KWARGS)
+    doc.build(story)
+
 class ProposalGenerator:
     """Handles the generation of personalized project proposals"""
 
@@ -201,152 +418,308 @@ class ProposalGenerator:
             logger.warning(f"Logo file not found at {self.logo_path}")
             self.logo_path = None
 
-        self.anthropic = Anthropic(api_key=self.api_key)
-        self.styles = getSampleStyleSheet()
-        self.custom_styles = {
-            'Heading1': ParagraphStyle(
-                'Heading1',
-                parent=self.styles['Heading1'],
-                fontSize=24,
-                spaceAfter=30,
-                textColor=colors.HexColor('#1a73e8')
-            ),
-            'Heading2': ParagraphStyle(
-                'Heading2',
-                parent=self.styles['Heading2'],
-                fontSize=18,
-                spaceAfter=20,
-                textColor=colors.HexColor('#333333')
-            ),
-            'Normal': ParagraphStyle(
-                'Normal',
-                parent=self.styles['Normal'],
-                fontSize=12,
-                spaceAfter=12,
-                textColor=colors.HexColor('#333333')
-            ),
-            'Quote': ParagraphStyle(
-                'Quote',
-                parent=self.styles['Normal'],
-                fontSize=12,
-                leftIndent=30,
-                rightIndent=30,
-                spaceAfter=20,
-                textColor=colors.HexColor('#666666'),
-                fontStyle='italic'
-            ),
-            'List': ParagraphStyle(
-                'List',
-                parent=self.styles['Normal'],
-                fontSize=12,
-                leftIndent=30,
-                spaceAfter=10,
-                bulletIndent=20,
-                textColor=colors.HexColor('#333333')
-            )
-        }
+        # The logo is not drawn yet; when one is configured the cover only reserves space for it
+        self._reserve_logo_space = self.logo_path is not None
+
+        self.anthropic = AsyncAnthropic(api_key=self.api_key)
+        self.styles = _BASE_STYLES
+        self.custom_styles = _CUSTOM_STYLES
+        # Cover and TOC flowables are reused across proposals until the styles they use change
+        self._static_flowables_styles = None
+        self._static_flowables = None
         logger.info("ProposalGenerator initialized successfully")
 
-    def generate_value_proposition(self, brief: ProposalBrief) -> ValuePropositionResponse:
+    async def generate_value_proposition(self, brief: ProposalBrief) -> ValuePropositionResponse:
         """Generate a personalized value proposition using Claude"""
         try:
             logger.info(f"Generating value proposition for {brief.customer.name}")
             prompt = f"""Create a compelling value proposition for the following client and product:
 
 Customer Information:
-{json.dumps(brief.customer.model_dump(), indent=2)}
+{brief.customer.model_dump_json(indent=2)}
 
 Product Information:
-{json.dumps(brief.product.model_dump(), indent=2)}
-
-Format your response as a JSON object with the following structure:
-{{
-    "introduction": "A compelling introduction paragraph",
-    "sections": [
-        {{
-            "title": "Section Title",
-            "points": [
-                "Benefit point 1 with metrics",
-                "Benefit point 2 with metrics"
-            ]
-        }}
-    ],
-    "conclusion": "A strong concluding paragraph"
-}}
-
-Focus on specific, measurable benefits and ROI. Use concrete numbers and metrics where possible."""
+{brief.product.model_dump_json(indent=2)}
+
+Focus on specific, measurable benefits and ROI. Use concrete numbers and metrics where possible.
+
+Record the value proposition with the {VALUE_PROPOSITION_TOOL['name']} tool."""
             
-            message = self.anthropic.beta.messages.create(
-                model="claude-3-5-sonnet-20241022",
+            message = await self.anthropic.beta.messages.create(
+                model=CLAUDE_MODEL,
                 max_tokens=2000,
-                system="You are an expert business proposal writer. Create compelling value propositions that focus on measurable benefits and ROI. Return ONLY valid JSON that matches the specified structure.",
+                system="You are an expert business proposal writer. Create compelling value propositions that focus on measurable benefits and ROI.",
+                tools=[VALUE_PROPOSITION_TOOL],
+                tool_choice={"type": "tool", "name": VALUE_PROPOSITION_TOOL['name']},
                 messages=[{
                     "role": "user",
                     "content": prompt
                 }]
             )
             
-            # Parse the response as JSON and validate against our model
-            response_json = json.loads(str(message.content))
-            return ValuePropositionResponse(**response_json)
+            # The forced tool call carries the structured response
+            return _construct_value_proposition(_response_input(message))
             
         except Exception as e:
             logger.error(f"Error generating value proposition: {str(e)}")
             raise
 
-    def generate_contract_terms(self, brief: ProposalBrief) -> ContractResponse:
+    async def generate_contract_terms(self, brief: ProposalBrief) -> ContractResponse:
         """Generate contract terms using Claude"""
         try:
             logger.info("Generating contract terms")
             prompt = f"""Create a professional contract for the following proposal:
 
 Proposal Details:
-{json.dumps(brief.model_dump(), indent=2)}
-
-Format your response as a JSON object with the following structure:
-{{
-    "sections": [
-        {{
-            "title": "Section Title",
-            "content": "Main section content",
-            "subsections": [
-                {{
-                    "title": "Subsection Title",
-                    "content": "Subsection content"
-                }}
-            ]
-        }}
-    ]
-}}
-
-Include the following sections:
-1. Scope of Services
-2. Pricing and Payment Terms
-3. Service Level Agreement
-4. Term and Termination
-5. Confidentiality
-6. Intellectual Property
-7. Limitation of Liability
-8. General Terms and Conditions"""
+{brief.model_dump_json(indent=2)}
+
+Include {CONTRACT_SECTIONS_PROMPT}
+
+Record the contract with the {CONTRACT_TOOL['name']} tool."""
             
-            message = self.anthropic.beta.messages.create(
-                model="claude-3-5-sonnet-20241022",
+            message = await self.anthropic.beta.messages.create(
+                model=CLAUDE_MODEL,
                 max_tokens=8096,
-                system="You are an expert contract writer. Create professional, comprehensive contracts that protect both parties' interests. Return ONLY valid JSON that matches the specified structure.",
+                system="You are an expert contract writer. Create professional, comprehensive contracts that protect both parties' interests.",
+                tools=[CONTRACT_TOOL],
+                tool_choice={"type": "tool", "name": CONTRACT_TOOL['name']},
                 messages=[{
                     "role": "user",
                     "content": prompt
                 }]
             )
             
-            # Parse the response as JSON and validate against our model
-            response_json = json.loads(str(message.content))
-            return ContractResponse(**response_json)
+            # The forced tool call carries the structured response
+            return _construct_contract(_response_input(message))
             
         except Exception as e:
             logger.error(f"Error generating contract terms: {str(e)}")
             raise
 
+    async def generate_proposal_content(
+        self,
+        brief: ProposalBrief
+    ) -> Tuple[ValuePropositionResponse, ContractResponse]:
+        """Generate the value proposition and contract terms with a single Claude call"""
+        try:
+            logger.info(f"Generating proposal content for {brief.customer.name}")
+            prompt = f"""Create a compelling value proposition and a professional contract for the following proposal:
+
+Proposal Details:
+{brief.model_dump_json(indent=2)}
+
+For the value proposition, focus on specific, measurable benefits and ROI. Use concrete numbers and metrics where possible.
+
+For the contract, include {CONTRACT_SECTIONS_PROMPT}
+
+Record both with the {PROPOSAL_CONTENT_TOOL['name']} tool."""
+            
+            message = await self.anthropic.beta.messages.create(
+                model=CLAUDE_MODEL,
+                max_tokens=8192,
+                system="You are an expert business proposal and contract writer. Create compelling value propositions that focus on measurable benefits and ROI, and professional, comprehensive contracts that protect both parties' interests.",
+                tools=[PROPOSAL_CONTENT_TOOL],
+                tool_choice={"type": "tool", "name": PROPOSAL_CONTENT_TOOL['name']},
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }]
+            )
+            
+            # Both parts share one output budget, so a cut-off response must not be parsed
+            if message.stop_reason == 'max_tokens':
+                raise ValueError("Proposal content response was truncated at the max_tokens limit")
+            
+            # The forced tool call carries both parts
+            response_json = _response_input(message)
+            _check_keys(response_json, ('value_proposition', 'contract'), 'Proposal content')
+            return (
+                _construct_value_proposition(response_json['value_proposition']),
+                _construct_contract(response_json['contract'])
+            )
+            
+        except Exception as e:
+            logger.error(f"Error generating proposal content: {str(e)}")
+            raise
+
+    async def generate_many(self, briefs: List[ProposalBrief], concurrency: int = 8) -> None:
+        """Generate proposals for several briefs concurrently, capping in-flight Claude calls"""
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        # Briefs are rendered in parallel worker processes, so two briefs that map to the
+        # same file would write it concurrently; reject the batch before any work starts
+        output_paths = [self._output_path(brief) for brief in briefs]
+        duplicates = sorted({str(path) for path in output_paths if output_paths.count(path) > 1})
+        if duplicates:
+            raise ValueError(f"Briefs in the batch share output paths: {', '.join(duplicates)}")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+
+        # doc.build is CPU-bound pure Python, so render in worker processes rather than threads
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            async def _one(brief: ProposalBrief, output_path: Path) -> None:
+                try:
+                    async with semaphore:
+                        value_prop, contract = await self.generate_proposal_content(brief)
+                    story = self.build_story(brief, value_prop, contract)
+                    await loop.run_in_executor(executor, _build_pdf, story, str(output_path))
+                    logger.info(f"Proposal generated successfully: {output_path}")
+                    
+                except Exception as e:
+                    logger.error(f"Error generating proposal for {brief.customer.name}: {str(e)}")
+                    raise
+
+            logger.info(f"Generating {len(briefs)} proposals with concurrency {concurrency}")
+            # Let every brief finish before the pool shuts down, even if some fail
+            results = await asyncio.gather(
+                *[_one(brief, output_path) for brief, output_path in zip(briefs, output_paths)],
+                return_exceptions=True
+            )
+
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            logger.error(f"{len(failures)} of {len(briefs)} proposals failed")
+            raise failures[0]
+
+    def _output_path(self, brief: ProposalBrief) -> Path:
+        """Return the PDF path for a brief, creating the output directory if needed"""
+        output_path = Path("proposals") / f"{brief.customer.name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf"
+        output_path.parent.mkdir(exist_ok=True)
+        return output_path
+
+    def build_story(
+        self,
+        brief: ProposalBrief,
+        value_proposition: ValuePropositionResponse,
+        contract_terms: ContractResponse
+    ) -> List[Flowable]:
+        """Build the ReportLab flowables for a proposal"""
+        # Build the document content; styles and the story's append/extend are
+        # bound to locals to avoid repeated attribute and dict lookups
+        styles = self.custom_styles
+        h1 = styles['Heading1']
+        h2 = styles['Heading2']
+        normal = styles['Normal']
+        list_style = styles['List']
+        quote = styles['Quote']
+        story = []
+        append = story.append
+        extend = story.extend
+        
+        if self._static_flowables_styles != (h1, normal):
+            self._static_flowables = _static_flowables(h1, normal)
+            self._static_flowables_styles = (h1, normal)
+        cover_title_flowables, toc_flowables = self._static_flowables
+        
+        # Cover Page
+        if self._reserve_logo_space:
+            append(Spacer(1, 2*inch))
+        
+        extend(cover_title_flowables)
+        append(Paragraph(brief.customer.name, h2))
+        append(Paragraph(brief.customer.address, normal))
+        append(Paragraph(f"Date: {datetime.now().strftime('%B %d, %Y')}", normal))
+        append(PageBreak())
+        
+        # Table of Contents
+        extend(toc_flowables)
+        
+        # Executive Summary
+        append(Paragraph("Executive Summary", h1))
+        append(Paragraph(brief.product.value_proposition, normal))
+        append(PageBreak())
+        
+        # Value Proposition
+        append(Paragraph("Value Proposition", h1))
+        append(Paragraph(value_proposition.introduction, normal))
+        
+        for section in value_proposition.sections:
+            append(Paragraph(section.title, h2))
+            extend(Paragraph(f"• {point}", list_style) for point in section.points)
+        
+        append(Paragraph(value_proposition.conclusion, quote))
+        append(PageBreak())
+        
+        # Scope of Work and Pricing
+        append(Paragraph("Scope of Work & Pricing", h1))
+        
+        # Setup Fee Section
+        append(Paragraph("Setup Fee", h2))
+        append(Paragraph(f"${brief.setup_fee:,.2f} USD", normal))
+        
+        extend(Paragraph(f"• {item}", list_style) for item in brief.setup_items)
+        
+        # Pricing Table
+        append(Paragraph("Usage Fees (Per Language)", h2))
+        
+        table_data = [['Contacts', 'Price (USD)', 'Per Contact']] + _pricing_rows(brief)
+        
+        table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a73e8')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+            ('ALIGN', (0, 0), (0, -1), 'CENTER')
+        ])
+        
+        table = Table(table_data)
+        table.setStyle(table_style)
+        append(table)
+        append(Spacer(1, 20))
+        
+        # Payment Terms
+        append(Paragraph("Payment Terms", h2))
+        extend(Paragraph(f"• {term}", list_style) for term in brief.payment_terms)
+        
+        append(PageBreak())
+        
+        # Terms and Conditions
+        append(Paragraph("Terms and Conditions", h1))
+        
+        for section in contract_terms.sections:
+            append(Paragraph(section.title, h2))
+            append(Paragraph(section.content, normal))
+            
+            if section.subsections:
+                for subsection in section.subsections:
+                    append(Paragraph(subsection['title'], h2))
+                    append(Paragraph(subsection['content'], normal))
+        
+        return story
+
+    def render_html_proposal(
+        self,
+        brief: ProposalBrief,
+        value_proposition: ValuePropositionResponse,
+        contract_terms: ContractResponse
+    ) -> str:
+        """Render the proposal as HTML using the precompiled Jinja template"""
+        try:
+            logger.info(f"Rendering HTML proposal for {brief.customer.name}")
+            return _PROPOSAL_TPL.render(
+                brief=brief,
+                value_proposition=value_proposition,
+                contract_terms=contract_terms,
+                setup_fee=f"${brief.setup_fee:,.2f}",
+                pricing_rows=_pricing_rows(brief),
+                toc_sections=TOC_SECTIONS,
+                date=datetime.now().strftime('%B %d, %Y')
+            )
+            
+        except Exception as e:
+            logger.error(f"Error rendering HTML proposal: {str(e)}")
+            raise
+
     def create_pdf_proposal(
         self, 
         brief: ProposalBrief,
@@ -356,133 +729,15 @@ Include the following sections:
         """Create a professionally formatted PDF proposal using reportlab"""
         try:
             logger.info(f"Creating PDF proposal for {brief.customer.name}")
-            
-            # Set up the document
-            output_path = Path("proposals") / f"{brief.customer.name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.pdf"
-            output_path.parent.mkdir(exist_ok=True)
-            
-            doc = SimpleDocTemplate(
-                str(output_path),
-                pagesize=letter,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
-            
-            # Build the document content
-            story = []
-            
-            # Cover Page
-            if self.logo_path:
-                img = Image.open(self.logo_path)
-                aspect = img.height / img.width
-                img_width = 2 * inch
-                img_height = img_width * aspect
-                story.append(Spacer(1, 2*inch))
-            
-            story.append(Paragraph("Project Proposal", self.custom_styles['Heading1']))
-            story.append(Spacer(1, inch))
-            story.append(Paragraph(f"Prepared for:", self.custom_styles['Normal']))
-            story.append(Paragraph(brief.customer.name, self.custom_styles['Heading2']))
-            story.append(Paragraph(brief.customer.address, self.custom_styles['Normal']))
-            story.append(Paragraph(f"Date: {datetime.now().strftime('%B %d, %Y')}", self.custom_styles['Normal']))
-            story.append(PageBreak())
-            
-            # Table of Contents
-            story.append(Paragraph("Table of Contents", self.custom_styles['Heading1']))
-            sections = ['Executive Summary', 'Value Proposition', 'Scope of Work', 'Pricing', 'Terms and Conditions']
-            for i, section in enumerate(sections, 1):
-                story.append(Paragraph(f"{i}. {section}", self.custom_styles['Normal']))
-            story.append(PageBreak())
-            
-            # Executive Summary
-            story.append(Paragraph("Executive Summary", self.custom_styles['Heading1']))
-            story.append(Paragraph(brief.product.value_proposition, self.custom_styles['Normal']))
-            story.append(PageBreak())
-            
-            # Value Proposition
-            story.append(Paragraph("Value Proposition", self.custom_styles['Heading1']))
-            story.append(Paragraph(value_proposition.introduction, self.custom_styles['Normal']))
-            
-            for section in value_proposition.sections:
-                story.append(Paragraph(section.title, self.custom_styles['Heading2']))
-                for point in section.points:
-                    story.append(Paragraph(f"• {point}", self.custom_styles['List']))
-            
-            story.append(Paragraph(value_proposition.conclusion, self.custom_styles['Quote']))
-            story.append(PageBreak())
-            
-            # Scope of Work and Pricing
-            story.append(Paragraph("Scope of Work & Pricing", self.custom_styles['Heading1']))
-            
-            # Setup Fee Section
-            story.append(Paragraph("Setup Fee", self.custom_styles['Heading2']))
-            story.append(Paragraph(f"${brief.setup_fee:,.2f} USD", self.custom_styles['Normal']))
-            
-            for item in brief.setup_items:
-                story.append(Paragraph(f"• {item}", self.custom_styles['List']))
-            
-            # Pricing Table
-            story.append(Paragraph("Usage Fees (Per Language)", self.custom_styles['Heading2']))
-            
-            table_data = [['Contacts', 'Price (USD)', 'Per Contact']]
-            for tier in brief.pricing_tiers:
-                table_data.append([
-                    f"{tier.contacts:,}",
-                    f"${tier.price:,.2f}",
-                    f"${tier.price_per_contact:.2f}"
-                ])
-            
-            table_style = TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a73e8')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
-                ('ALIGN', (0, 0), (0, -1), 'CENTER')
-            ])
-            
-            table = Table(table_data)
-            table.setStyle(table_style)
-            story.append(table)
-            story.append(Spacer(1, 20))
-            
-            # Payment Terms
-            story.append(Paragraph("Payment Terms", self.custom_styles['Heading2']))
-            for term in brief.payment_terms:
-                story.append(Paragraph(f"• {term}", self.custom_styles['List']))
-            
-            story.append(PageBreak())
-            
-            # Terms and Conditions
-            story.append(Paragraph("Terms and Conditions", self.custom_styles['Heading1']))
-            
-            for section in contract_terms.sections:
-                story.append(Paragraph(section.title, self.custom_styles['Heading2']))
-                story.append(Paragraph(section.content, self.custom_styles['Normal']))
-                
-                if section.subsections:
-                    for subsection in section.subsections:
-                        story.append(Paragraph(subsection['title'], self.custom_styles['Heading2']))
-                        story.append(Paragraph(subsection['content'], self.custom_styles['Normal']))
-            
-            # Build the PDF
-            doc.build(story)
+            output_path = self._output_path(brief)
+            _build_pdf(self.build_story(brief, value_proposition, contract_terms), str(output_path))
             logger.info(f"Proposal generated successfully: {output_path}")
             
         except Exception as e:
             logger.error(f"Error creating PDF proposal: {str(e)}")
             raise
 
-def main():
+async def main():
     try:
         # Load the brief
         brief = load_brief('input/brief-1.txt')
@@ -493,9 +748,8 @@ def main():
             company_logo_path='ReachGenie.png'
         )
 
-        # Generate proposal components
-        value_prop = generator.generate_value_proposition(brief)
-        contract = generator.generate_contract_terms(brief)
+        # Generate proposal components with a single batched call
+        value_prop, contract = await generator.generate_proposal_content(brief)
 
         # Create PDF proposal
         generator.create_pdf_proposal(brief, value_prop, contract)
@@ -505,4 +759,4 @@ def main():
         raise
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
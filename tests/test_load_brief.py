@@ -0,0 +1,71 @@
+from decimal import Decimal
+
+import pytest
+
+from main import load_brief
+
+BRIEF = """Customer: Acme Inc
+ADDRESS: 1 Main Street, Berlin
+URL: https://acme.example
+BUSINESS OF CUSTOMER: Industrial widgets
+
+PRODUCT BEING SOLD: ReachGenie
+VALUE PROPOSITION: More qualified meetings
+URL: https://reachgenie.example
+ADDRESS: 2 Market Street, London
+
+SETUP FEE: $1,500 USD
+- Onboarding workshop
+- CRM integration
+
+USAGE FEE FOR A CAMPAIGN (PER LANGUAGE):
+- FOR UP TO 10,000 CONTACTS: $1,000 ($0.10 per contact)
+- FOR UP TO 100,000 CONTACTS: $5,000 ($.05 per contact)
+
+PAYMENT TERMS:
+- 50% upfront
+- Net 30
+"""
+
+
+def write_brief(tmp_path, text):
+    path = tmp_path / "brief.txt"
+    path.write_text(text)
+    return str(path)
+
+
+def test_load_brief_parses_all_sections(tmp_path):
+    brief = load_brief(write_brief(tmp_path, BRIEF))
+
+    assert brief.customer.name == "Acme Inc"
+    assert brief.customer.address == "1 Main Street, Berlin"
+    assert brief.customer.url == "https://acme.example"
+    assert brief.customer.business_description == "Industrial widgets"
+    assert brief.product.name == "ReachGenie"
+    assert brief.product.value_proposition == "More qualified meetings"
+    assert brief.product.url == "https://reachgenie.example"
+    assert brief.product.company_address == "2 Market Street, London"
+    assert brief.setup_fee == Decimal("1500")
+    assert brief.setup_items == ["Onboarding workshop", "CRM integration"]
+    assert brief.payment_terms == ["50% upfront", "Net 30"]
+
+
+def test_load_brief_parses_pricing_tiers(tmp_path):
+    brief = load_brief(write_brief(tmp_path, BRIEF))
+
+    tiers = [(tier.contacts, tier.price, tier.price_per_contact) for tier in brief.pricing_tiers]
+    assert tiers == [
+        (10000, Decimal("1000"), Decimal("0.10")),
+        (100000, Decimal("5000"), Decimal("0.05")),
+    ]
+
+
+@pytest.mark.parametrize("tier_line", [
+    "- FOR UP TO 10,000 CONTACTS: $1,000",
+    "- FOR UP TO 10,000 CONTACTS: $1,000 (per contact)",
+])
+def test_load_brief_rejects_tier_without_price(tmp_path, tier_line):
+    text = BRIEF.replace("- FOR UP TO 10,000 CONTACTS: $1,000 ($0.10 per contact)", tier_line)
+
+    with pytest.raises(ValueError, match="Could not parse pricing tier"):
+        load_brief(write_brief(tmp_path, text))